@@ -11,6 +11,8 @@ from fastapi.responses import RedirectResponse
 import os
 from pathlib import Path
 
+from src.app_defaults import fresh_activities
+
 app = FastAPI(title="Mergington High School API",
               description="API for viewing and signing up for extracurricular activities")
 
@@ -19,63 +21,14 @@ current_dir = Path(__file__).parent
 app.mount("/static", StaticFiles(directory=os.path.join(Path(__file__).parent,
           "static")), name="static")
 
-# In-memory activity database
-activities = {
-    "Soccer Team": {
-        "description": "Join the varsity soccer team and compete in regional tournaments",
-        "schedule": "Mondays and Wednesdays, 4:00 PM - 6:00 PM",
-        "max_participants": 25,
-        "participants": ["alex@mergington.edu", "ryan@mergington.edu"]
-    },
-    "Basketball Club": {
-        "description": "Practice basketball skills and participate in friendly matches",
-        "schedule": "Tuesdays and Thursdays, 4:00 PM - 5:30 PM",
-        "max_participants": 15,
-        "participants": ["sarah@mergington.edu", "james@mergington.edu"]
-    },
-    "Art Studio": {
-        "description": "Explore painting, drawing, and sculpture techniques",
-        "schedule": "Wednesdays, 3:30 PM - 5:30 PM",
-        "max_participants": 18,
-        "participants": ["lily@mergington.edu", "ava@mergington.edu"]
-    },
-    "Drama Club": {
-        "description": "Perform in school plays and develop acting skills",
-        "schedule": "Thursdays, 3:30 PM - 5:00 PM",
-        "max_participants": 20,
-        "participants": ["noah@mergington.edu", "isabella@mergington.edu"]
-    },
-    "Science Olympiad": {
-        "description": "Compete in science competitions and conduct experiments",
-        "schedule": "Fridays, 3:00 PM - 5:00 PM",
-        "max_participants": 16,
-        "participants": ["ethan@mergington.edu", "mia@mergington.edu"]
-    },
-    "Debate Team": {
-        "description": "Develop critical thinking and public speaking through debates",
-        "schedule": "Mondays, 3:30 PM - 5:00 PM",
-        "max_participants": 14,
-        "participants": ["william@mergington.edu", "charlotte@mergington.edu"]
-    },
-    "Chess Club": {
-        "description": "Learn strategies and compete in chess tournaments",
-        "schedule": "Fridays, 3:30 PM - 5:00 PM",
-        "max_participants": 12,
-        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-    },
-    "Programming Class": {
-        "description": "Learn programming fundamentals and build software projects",
-        "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-        "max_participants": 20,
-        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-    },
-    "Gym Class": {
-        "description": "Physical education and sports activities",
-        "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-        "max_participants": 30,
-        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-    }
-}
+# Error messages returned in the "detail" field of failed requests
+ACTIVITY_NOT_FOUND = "Activity not found"
+ALREADY_SIGNED_UP = "Student already signed up for this activity"
+ACTIVITY_FULL = "Activity is full"
+NOT_REGISTERED = "Student is not registered for this activity"
+
+# In-memory activity database, seeded from the defaults
+activities = fresh_activities()
 
 
 @app.get("/")
@@ -93,18 +46,18 @@ def signup_for_activity(activity_name: str, email: str):
     """Sign up a student for an activity"""
     # Validate activity exists
     if activity_name not in activities:
-        raise HTTPException(status_code=404, detail="Activity not found")
+        raise HTTPException(status_code=404, detail=ACTIVITY_NOT_FOUND)
 
     # Get the specific activity
     activity = activities[activity_name]
 
     # Validate student is not already signed up
     if email in activity["participants"]:
-        raise HTTPException(status_code=400, detail="Student already signed up for this activity")
+        raise HTTPException(status_code=400, detail=ALREADY_SIGNED_UP)
 
     # Validate activity capacity
     if len(activity["participants"]) >= activity["max_participants"]:
-        raise HTTPException(status_code=400, detail="Activity is full")
+        raise HTTPException(status_code=400, detail=ACTIVITY_FULL)
     # Add student
     activity["participants"].append(email)
     return {"message": f"Signed up {email} for {activity_name}"}
@@ -115,14 +68,14 @@ def unregister_from_activity(activity_name: str, email: str):
     """Unregister a student from an activity"""
     # Validate activity exists
     if activity_name not in activities:
-        raise HTTPException(status_code=404, detail="Activity not found")
+        raise HTTPException(status_code=404, detail=ACTIVITY_NOT_FOUND)
 
     # Get the specific activity
     activity = activities[activity_name]
 
     # Validate student is signed up
     if email not in activity["participants"]:
-        raise HTTPException(status_code=400, detail="Student is not registered for this activity")
+        raise HTTPException(status_code=400, detail=NOT_REGISTERED)
 
     # Remove student
     activity["participants"].remove(email)
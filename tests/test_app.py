@@ -1,42 +1,65 @@
 """
 Tests for the Mergington High School Activities API
+
+Each test runs against its own copy of the activities data, patched into
+src.app, so the suite can be run in parallel with pytest-xdist:
+
+    pytest -n auto
+
+Multi-request workflow tests are marked slow; skip them for a quicker
+local run with:
+
+    pytest -m "not slow"
 """
 
+import asyncio
+from types import SimpleNamespace
+from urllib.parse import quote
+
+import httpx
 import pytest
+import pytest_asyncio
 from fastapi.testclient import TestClient
-from src.app import app, activities
+from src.app import app, ACTIVITY_NOT_FOUND, ALREADY_SIGNED_UP, NOT_REGISTERED
+from src.app_defaults import DEFAULT_ACTIVITIES as _BASELINE, fresh_activities
+
+NONEXISTENT_ACTIVITY = "Nonexistent Activity"
 
+# Request paths per activity, URL-quoted once for the whole module
+_ACTIVITY_NAMES = [*_BASELINE, NONEXISTENT_ACTIVITY]
+SIGNUP_URLS = {name: f"/activities/{quote(name)}/signup" for name in _ACTIVITY_NAMES}
+UNREGISTER_URLS = {name: f"/activities/{quote(name)}/unregister" for name in _ACTIVITY_NAMES}
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client for the FastAPI app"""
+    """Create a test client for the FastAPI app, shared across the session"""
     return TestClient(app)
 
 
+@pytest_asyncio.fixture
+async def async_client():
+    """Create an async client that talks to the app in-process over ASGI"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+
+
+@pytest.fixture(scope="session")
+def urls():
+    """Pair the precomputed signup and unregister paths with email params"""
+    return SimpleNamespace(
+        signup=lambda activity, email: (SIGNUP_URLS[activity], {"email": email}),
+        unregister=lambda activity, email: (UNREGISTER_URLS[activity], {"email": email}),
+    )
+
+
 @pytest.fixture(autouse=True)
-def reset_activities():
-    """Reset activities to initial state before each test"""
-    activities.clear()
-    activities.update({
-        "Soccer Team": {
-            "description": "Join the varsity soccer team and compete in regional tournaments",
-            "schedule": "Mondays and Wednesdays, 4:00 PM - 6:00 PM",
-            "max_participants": 25,
-            "participants": ["alex@mergington.edu", "ryan@mergington.edu"]
-        },
-        "Basketball Club": {
-            "description": "Practice basketball skills and participate in friendly matches",
-            "schedule": "Tuesdays and Thursdays, 4:00 PM - 5:30 PM",
-            "max_participants": 15,
-            "participants": ["sarah@mergington.edu", "james@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        }
-    })
+def activities(monkeypatch):
+    """Give each test a fresh copy of the baseline activities"""
+    fresh = fresh_activities()
+    monkeypatch.setattr("src.app.activities", fresh)
+    return fresh
 
 
 class TestRootEndpoint:
@@ -58,22 +81,23 @@ class TestGetActivities:
         assert response.status_code == 200
         
         data = response.json()
-        assert len(data) == 3
+        assert len(data) == len(_BASELINE)
         assert "Soccer Team" in data
         assert "Basketball Club" in data
         assert "Programming Class" in data
 
-    def test_get_activities_contains_correct_structure(self, client):
+    @pytest.mark.parametrize("activity", list(_BASELINE))
+    def test_get_activities_contains_correct_structure(self, client, activity):
         """Test that activities have the correct structure"""
         response = client.get("/activities")
         data = response.json()
         
-        soccer = data["Soccer Team"]
-        assert "description" in soccer
-        assert "schedule" in soccer
-        assert "max_participants" in soccer
-        assert "participants" in soccer
-        assert isinstance(soccer["participants"], list)
+        details = data[activity]
+        assert "description" in details
+        assert "schedule" in details
+        assert "max_participants" in details
+        assert "participants" in details
+        assert isinstance(details["participants"], list)
 
     def test_get_activities_shows_participants(self, client):
         """Test that participants are included in the response"""
@@ -87,11 +111,10 @@ class TestGetActivities:
 class TestSignupForActivity:
     """Tests for POST /activities/{activity_name}/signup endpoint"""
 
-    def test_signup_new_participant_success(self, client):
+    def test_signup_new_participant_success(self, client, urls, activities):
         """Test successful signup for a new participant"""
-        response = client.post(
-            "/activities/Soccer Team/signup?email=newstudent@mergington.edu"
-        )
+        url, params = urls.signup("Soccer Team", "newstudent@mergington.edu")
+        response = client.post(url, params=params)
         assert response.status_code == 200
         
         data = response.json()
@@ -100,57 +123,42 @@ class TestSignupForActivity:
         assert "Soccer Team" in data["message"]
         
         # Verify participant was added
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "newstudent@mergington.edu" in activities_data["Soccer Team"]["participants"]
+        assert "newstudent@mergington.edu" in activities["Soccer Team"]["participants"]
 
-    def test_signup_duplicate_participant_fails(self, client):
+    def test_signup_duplicate_participant_fails(self, client, urls):
         """Test that signing up an already registered participant fails"""
-        response = client.post(
-            "/activities/Soccer Team/signup?email=alex@mergington.edu"
-        )
+        url, params = urls.signup("Soccer Team", "alex@mergington.edu")
+        response = client.post(url, params=params)
         assert response.status_code == 400
         
         data = response.json()
         assert "detail" in data
-        assert "already signed up" in data["detail"].lower()
-
-    def test_signup_nonexistent_activity_fails(self, client):
-        """Test that signing up for a non-existent activity fails"""
-        response = client.post(
-            "/activities/Nonexistent Activity/signup?email=student@mergington.edu"
-        )
-        assert response.status_code == 404
-        
-        data = response.json()
-        assert "detail" in data
-        assert "not found" in data["detail"].lower()
+        assert data["detail"] == ALREADY_SIGNED_UP
 
-    def test_signup_multiple_participants_to_same_activity(self, client):
+    @pytest.mark.asyncio
+    async def test_signup_multiple_participants_to_same_activity(self, async_client, urls, activities):
         """Test signing up multiple new participants"""
         emails = ["student1@mergington.edu", "student2@mergington.edu", "student3@mergington.edu"]
         
-        for email in emails:
-            response = client.post(f"/activities/Basketball Club/signup?email={email}")
+        requests = [urls.signup("Basketball Club", email) for email in emails]
+        responses = await asyncio.gather(*(
+            async_client.post(url, params=params) for url, params in requests
+        ))
+        for response in responses:
             assert response.status_code == 200
         
         # Verify all participants were added
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        basketball_participants = activities_data["Basketball Club"]["participants"]
-        
-        for email in emails:
-            assert email in basketball_participants
+        basketball_participants = set(activities["Basketball Club"]["participants"])
+        assert set(emails).issubset(basketball_participants)
 
 
 class TestUnregisterFromActivity:
     """Tests for DELETE /activities/{activity_name}/unregister endpoint"""
 
-    def test_unregister_existing_participant_success(self, client):
+    def test_unregister_existing_participant_success(self, client, urls, activities):
         """Test successful unregistration of an existing participant"""
-        response = client.delete(
-            "/activities/Soccer Team/unregister?email=alex@mergington.edu"
-        )
+        url, params = urls.unregister("Soccer Team", "alex@mergington.edu")
+        response = client.delete(url, params=params)
         assert response.status_code == 200
         
         data = response.json()
@@ -159,86 +167,93 @@ class TestUnregisterFromActivity:
         assert "Unregistered" in data["message"]
         
         # Verify participant was removed
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "alex@mergington.edu" not in activities_data["Soccer Team"]["participants"]
+        assert "alex@mergington.edu" not in activities["Soccer Team"]["participants"]
 
-    def test_unregister_nonregistered_participant_fails(self, client):
+    def test_unregister_nonregistered_participant_fails(self, client, urls):
         """Test that unregistering a non-registered participant fails"""
-        response = client.delete(
-            "/activities/Soccer Team/unregister?email=notregistered@mergington.edu"
-        )
+        url, params = urls.unregister("Soccer Team", "notregistered@mergington.edu")
+        response = client.delete(url, params=params)
         assert response.status_code == 400
         
         data = response.json()
         assert "detail" in data
-        assert "not registered" in data["detail"].lower()
-
-    def test_unregister_from_nonexistent_activity_fails(self, client):
-        """Test that unregistering from a non-existent activity fails"""
-        response = client.delete(
-            "/activities/Nonexistent Activity/unregister?email=student@mergington.edu"
-        )
-        assert response.status_code == 404
-        
-        data = response.json()
-        assert "detail" in data
-        assert "not found" in data["detail"].lower()
+        assert data["detail"] == NOT_REGISTERED
 
-    def test_unregister_all_participants(self, client):
+    @pytest.mark.asyncio
+    async def test_unregister_all_participants(self, async_client, urls, activities):
         """Test unregistering all participants from an activity"""
         participants = ["alex@mergington.edu", "ryan@mergington.edu"]
         
-        for email in participants:
-            response = client.delete(f"/activities/Soccer Team/unregister?email={email}")
-            assert response.status_code == 200
+        requests = [urls.unregister("Soccer Team", email) for email in participants]
+        responses = await asyncio.gather(*(
+            async_client.delete(url, params=params) for url, params in requests
+        ))
+        assert [response.status_code for response in responses] == [200] * len(participants)
         
         # Verify all participants were removed
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert len(activities_data["Soccer Team"]["participants"]) == 0
+        assert not activities["Soccer Team"]["participants"]
+
+
+class TestNonexistentActivity:
+    """Tests for requests targeting an activity that does not exist"""
+
+    @pytest.mark.parametrize("method,endpoint", [
+        pytest.param("post", "signup", id="signup"),
+        pytest.param("delete", "unregister", id="unregister"),
+    ])
+    def test_nonexistent_activity_fails(self, client, urls, method, endpoint):
+        """Test that signing up for or unregistering from a non-existent activity fails"""
+        url, params = getattr(urls, endpoint)(NONEXISTENT_ACTIVITY, "student@mergington.edu")
+        response = getattr(client, method)(url, params=params)
+        assert response.status_code == 404
+        
+        data = response.json()
+        assert "detail" in data
+        assert data["detail"] == ACTIVITY_NOT_FOUND
 
 
 class TestActivityWorkflow:
     """Integration tests for complete workflows"""
 
-    def test_signup_and_unregister_workflow(self, client):
+    pytestmark = pytest.mark.slow
+
+    @pytest.mark.asyncio
+    async def test_signup_and_unregister_workflow(self, async_client, urls, activities):
         """Test complete workflow of signing up and then unregistering"""
         email = "workflow@mergington.edu"
         activity = "Programming Class"
         
         # Sign up
-        signup_response = client.post(f"/activities/{activity}/signup?email={email}")
+        url, params = urls.signup(activity, email)
+        signup_response = await async_client.post(url, params=params)
         assert signup_response.status_code == 200
         
         # Verify signup
-        activities_response = client.get("/activities")
-        assert email in activities_response.json()[activity]["participants"]
+        assert email in activities[activity]["participants"]
         
         # Unregister
-        unregister_response = client.delete(f"/activities/{activity}/unregister?email={email}")
+        url, params = urls.unregister(activity, email)
+        unregister_response = await async_client.delete(url, params=params)
         assert unregister_response.status_code == 200
         
         # Verify unregistration
-        activities_response = client.get("/activities")
-        assert email not in activities_response.json()[activity]["participants"]
+        assert email not in activities[activity]["participants"]
 
-    def test_participant_count_updates_correctly(self, client):
+    def test_participant_count_updates_correctly(self, client, urls, activities):
         """Test that participant count changes correctly with signup and unregister"""
         activity = "Basketball Club"
         
+        participants = activities[activity]["participants"]
+        
         # Get initial count
-        initial_response = client.get("/activities")
-        initial_count = len(initial_response.json()[activity]["participants"])
+        initial_count = len(participants)
         
         # Add a participant
-        client.post(f"/activities/{activity}/signup?email=new@mergington.edu")
-        after_signup = client.get("/activities")
-        signup_count = len(after_signup.json()[activity]["participants"])
-        assert signup_count == initial_count + 1
+        url, params = urls.signup(activity, "new@mergington.edu")
+        client.post(url, params=params)
+        assert len(participants) == initial_count + 1
         
         # Remove a participant
-        client.delete(f"/activities/{activity}/unregister?email=new@mergington.edu")
-        after_unregister = client.get("/activities")
-        final_count = len(after_unregister.json()[activity]["participants"])
-        assert final_count == initial_count
+        url, params = urls.unregister(activity, "new@mergington.edu")
+        client.delete(url, params=params)
+        assert len(participants) == initial_count